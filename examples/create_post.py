@@ -53,27 +53,101 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Ensure project root is on sys.path when running as a script (e.g. python examples/create_post.py)
 if __package__ is None:  # pragma: no cover - runtime convenience
     sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from x_client.config import ConfigManager
-from x_client.exceptions import (
-    ConfigurationError,
-    MediaProcessingFailed,
-    MediaValidationError,
-    RateLimitExceeded,
-    XClientError,
+# x_client imports are deferred to the helpers below so argument-validation
+# failures return before the package (tweepy, pydantic, mcp) is loaded.
+if TYPE_CHECKING:  # pragma: no cover - only for static type checkers
+    from x_client.config import XCredentials
+    from x_client.exceptions import XClientError
+    from x_client.services.media_service import MediaService
+    from x_client.services.post_service import PostService
+
+# Multi-line hints shown after common failures (built once at import).
+_CREDENTIALS_HELP = "\n".join(
+    [
+        "",
+        "Please set environment variables or create a .env file:",
+        "  - X_API_KEY",
+        "  - X_API_SECRET",
+        "  - X_ACCESS_TOKEN",
+        "  - X_ACCESS_TOKEN_SECRET",
+        "  - X_BEARER_TOKEN (optional)",
+    ]
+)
+_MEDIA_FORMATS_HELP = "\n".join(
+    [
+        "",
+        "Supported formats:",
+        "  - Images: PNG, JPEG, GIF, WebP (max 5MB)",
+        "  - Videos: MP4 (max 512MB)",
+    ]
+)
+_MEDIA_PROCESSING_HELP = "\n".join(
+    [
+        "",
+        "X's media processing encountered an error.",
+        "Please check the file format and encoding.",
+    ]
 )
-from x_client.factory import XClientFactory
-from x_client.services.media_service import MediaService
-from x_client.services.post_service import PostService
 
 
-def main() -> int:
-    """Main entry point for the example."""
+@lru_cache(maxsize=4)
+def _load_credentials(dotenv_path: Path | None) -> XCredentials:
+    """Load credentials once per dotenv path when main() is called repeatedly."""
+    from x_client.config import ConfigManager
+
+    config = ConfigManager(dotenv_path=dotenv_path) if dotenv_path else ConfigManager()
+    return config.load_credentials()
+
+
+@lru_cache(maxsize=4)
+def _get_services(dotenv_path: Path | None) -> tuple[PostService, MediaService]:
+    """Build services once per dotenv path so repeated calls share one client."""
+    from x_client.factory import XClientFactory
+    from x_client.services.media_service import MediaService
+    from x_client.services.post_service import PostService
+
+    client = XClientFactory.create_from_credentials(_load_credentials(dotenv_path))
+    return PostService(client), MediaService(client)
+
+
+@lru_cache(maxsize=1)
+def _error_reports() -> tuple[tuple[type[XClientError], str, str], ...]:
+    """Build the (exception type, label, hint) table once, on first error."""
+    from x_client.exceptions import (
+        ConfigurationError,
+        MediaProcessingFailed,
+        MediaValidationError,
+    )
+
+    return (
+        (ConfigurationError, "Configuration error", _CREDENTIALS_HELP),
+        (MediaValidationError, "Media validation error", _MEDIA_FORMATS_HELP),
+        (MediaProcessingFailed, "Media processing failed", _MEDIA_PROCESSING_HELP),
+    )
+
+
+def _report_error(exc: XClientError) -> None:
+    """Print a library error with the matching hint, if any."""
+    # First isinstance match wins; anything else is a generic API error.
+    for exc_type, label, hint in _error_reports():
+        if isinstance(exc, exc_type):
+            print(f"❌ {label}: {exc}")
+            print(hint)
+            return
+
+    print(f"❌ X API error: {exc}")
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Post to X with optional media attachment"
     )
@@ -144,7 +218,12 @@ def main() -> int:
         help="Delete the given post ID (utility for cleaning failed threads)",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for the example."""
+    args = _build_parser().parse_args(argv)
 
     # Validate arguments
     if args.image and args.video:
@@ -190,22 +269,19 @@ def main() -> int:
         print("Error: Provide text or --thread-file for post/thread actions")
         return 1
 
+    from x_client.exceptions import RateLimitExceeded, XClientError
+
     try:
         # Step 1: Load credentials
         print("Loading credentials...")
-        config = ConfigManager(dotenv_path=args.dotenv) if args.dotenv else ConfigManager()
-        credentials = config.load_credentials()
+        _load_credentials(args.dotenv)
         print("✅ Credentials loaded")
 
-        # Step 2: Create client using factory
+        # Step 2-3: Create client using factory and initialize services
         print("Initializing X client...")
-        client = XClientFactory.create_from_credentials(credentials)
+        post_service, media_service = _get_services(args.dotenv)
         print("✅ Client initialized (dual-client: v2 + v1.1)")
 
-        # Step 3: Initialize services
-        post_service = PostService(client)
-        media_service = MediaService(client)
-
         if delete_mode:
             target_id = args.delete
             print(f"Deleting post ID: {target_id}")
@@ -316,31 +392,8 @@ def main() -> int:
         print(f"\n🎉 Success! Post URL: https://x.com/i/web/status/{post.id}")
         return 0
 
-    except ConfigurationError as e:
-        print(f"❌ Configuration error: {e}")
-        print("\nPlease set environment variables or create a .env file:")
-        print("  - X_API_KEY")
-        print("  - X_API_SECRET")
-        print("  - X_ACCESS_TOKEN")
-        print("  - X_ACCESS_TOKEN_SECRET")
-        print("  - X_BEARER_TOKEN (optional)")
-        return 1
-
-    except MediaValidationError as e:
-        print(f"❌ Media validation error: {e}")
-        print("\nSupported formats:")
-        print("  - Images: PNG, JPEG, GIF, WebP (max 5MB)")
-        print("  - Videos: MP4 (max 512MB)")
-        return 1
-
-    except MediaProcessingFailed as e:
-        print(f"❌ Media processing failed: {e}")
-        print("\nX's media processing encountered an error.")
-        print("Please check the file format and encoding.")
-        return 1
-
     except XClientError as e:
-        print(f"❌ X API error: {e}")
+        _report_error(e)
         return 1
 
     except Exception as e:
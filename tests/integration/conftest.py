@@ -0,0 +1,40 @@
+"""Shared fixtures for integration tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from x_client.config import XCredentials
+
+_PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\0" * 100  # Valid PNG header + data
+_MP4_BYTES = b"\0" * 1024  # Well under tweepy's 1 MiB chunk: a single APPEND
+
+
+@pytest.fixture(scope="session")
+def credentials() -> XCredentials:
+    """Provide valid test credentials (including a bearer token)."""
+    return XCredentials(
+        api_key="test_api_key",
+        api_secret="test_api_secret",
+        access_token="test_access_token",
+        access_token_secret="test_access_token_secret",
+        bearer_token="test_bearer_token",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_image_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary PNG file once per test session (treat as read-only)."""
+    file_path = tmp_path_factory.mktemp("media") / "test_image.png"
+    file_path.write_bytes(_PNG_BYTES)
+    return file_path
+
+
+@pytest.fixture(scope="session")
+def mock_video_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a temporary MP4 file once per test session (treat as read-only)."""
+    file_path = tmp_path_factory.mktemp("media") / "test_video.mp4"
+    file_path.write_bytes(_MP4_BYTES)
+    return file_path
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 # Twitter API v2 responses
 TWEET_RESPONSE = {
     "data": {
@@ -121,3 +123,39 @@ RATE_LIMIT_ERROR_RESPONSE = {
         }
     ]
 }
+
+# Twitter API v2 error responses (problem-details style)
+RATE_LIMIT_V2_ERROR_RESPONSE = {
+    "errors": [
+        {
+            "message": "Rate limit exceeded",
+            "type": "about:blank",
+        }
+    ]
+}
+
+RATE_LIMIT_HEADERS = {"x-rate-limit-reset": "1728730800"}
+
+UNAUTHORIZED_ERROR_RESPONSE = {
+    "errors": [
+        {
+            "message": "Unauthorized",
+            "type": "about:blank",
+        }
+    ]
+}
+
+TWEET_SUCCESS_RESPONSE = {
+    "data": {
+        "id": "1234567890",
+        "text": "Test post",
+    }
+}
+
+# Pre-encoded bodies for mocks, serialized once at import instead of on every
+# registration or intercepted request.
+MEDIA_UPLOAD_IMAGE_RESPONSE_BYTES = json.dumps(MEDIA_UPLOAD_IMAGE_RESPONSE).encode()
+MEDIA_UPLOAD_VIDEO_INIT_RESPONSE_BYTES = json.dumps(MEDIA_UPLOAD_VIDEO_INIT_RESPONSE).encode()
+MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE_BYTES = json.dumps(MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE).encode()
+MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED_BYTES = json.dumps(MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED).encode()
+TWEET_RESPONSE_BYTES = json.dumps(TWEET_RESPONSE).encode()
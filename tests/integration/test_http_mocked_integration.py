@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from collections import deque
+from collections.abc import Callable
+import json
 from pathlib import Path
 import re
-from urllib.parse import parse_qs, urlparse
 
 import pytest
 import responses
 
+from x_client.clients.rate_limited_client import RateLimitedClient
 from x_client.config import ConfigManager, XCredentials
 from x_client.exceptions import MediaProcessingFailed, MediaProcessingTimeout
 from x_client.factory import XClientFactory
@@ -17,23 +18,43 @@ from x_client.services.media_service import MediaService
 from x_client.services.post_service import PostService
 
 from .fixtures import (
-    MEDIA_UPLOAD_IMAGE_RESPONSE,
+    MEDIA_UPLOAD_IMAGE_RESPONSE_BYTES,
     MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE,
-    MEDIA_UPLOAD_VIDEO_INIT_RESPONSE,
+    MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE_BYTES,
+    MEDIA_UPLOAD_VIDEO_INIT_RESPONSE_BYTES,
     MEDIA_UPLOAD_VIDEO_STATUS_FAILED,
     MEDIA_UPLOAD_VIDEO_STATUS_PROCESSING,
     MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED,
-    TWEET_RESPONSE,
+    MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED_BYTES,
+    TWEET_RESPONSE_BYTES,
 )
 
 
+TWEETS_ENDPOINT = "https://api.twitter.com/2/tweets"
 UPLOAD_ENDPOINT = "https://upload.twitter.com/1.1/media/upload.json"
-UPLOAD_ENDPOINT_PATTERN = re.compile(r"https://upload\.twitter\.com/1\.1/media/upload\.json(?:\?.*)?$")
+# INIT/FINALIZE send ``command`` form-encoded; multipart APPEND bodies do not match.
+_COMMAND_RE = re.compile(rb"(?:^|[&?])command=([A-Za-z]+)")
+_JSON_HDR = {"Content-Type": "application/json"}
+# Callback return values are immutable, so the fixed ones are built once.
+_INIT_RESP = (200, _JSON_HDR, MEDIA_UPLOAD_VIDEO_INIT_RESPONSE_BYTES)
+_APPEND_RESP = (204, _JSON_HDR, b"")
 
 
-pytestmark = pytest.mark.skip(
-    reason="メディアアップロードの統合テストは一時的に手動検証へ切り替え中"
-)
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skip(reason="メディアアップロードの統合テストは一時的に手動検証へ切り替え中"),
+]
+
+
+# (method, url, pre-encoded body, status) for endpoints with fixed JSON responses.
+_TWEET_REG = (responses.POST, TWEETS_ENDPOINT, TWEET_RESPONSE_BYTES, 201)
+_IMAGE_UPLOAD_REG = (responses.POST, UPLOAD_ENDPOINT, MEDIA_UPLOAD_IMAGE_RESPONSE_BYTES, 200)
+
+
+def _register_all(*registrations: tuple[str, str, bytes, int]) -> None:
+    """Register fixed JSON responses for each (method, url, body, status) entry."""
+    for method, url, body, status in registrations:
+        responses.add(method, url, body=body, status=status, content_type="application/json")
 
 
 def _register_chunked_video_flow(
@@ -44,75 +65,65 @@ def _register_chunked_video_flow(
     """Register INIT/APPEND/FINALIZE/STATUS flow for chunked uploads."""
 
     call_tracker = {"init": 0, "append": 0, "finalize": 0, "status": 0}
-    finalize_payload = finalize_response or MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE
-    status_queue: deque[dict] = deque(status_sequence)
+    # Serialize every response body once up front; callbacks only return them.
+    finalize_body = (
+        json.dumps(finalize_response).encode()
+        if finalize_response
+        else MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE_BYTES
+    )
+    # Polling past the end of the sequence repeats the last known status.
+    status_bodies = tuple(json.dumps(payload).encode() for payload in status_sequence) or (
+        MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED_BYTES,
+    )
+    last_status = len(status_bodies) - 1
+    status_index = 0
+    resp_by_command = {
+        "INIT": _INIT_RESP,
+        "APPEND": _APPEND_RESP,
+        "FINALIZE": (200, _JSON_HDR, finalize_body),
+    }
 
-    def upload_callback(request: responses.Call) -> tuple[int, dict[str, str], str]:
+    def upload_callback(request: responses.Call) -> tuple[int, dict[str, str], bytes]:
         if not request.url.startswith(UPLOAD_ENDPOINT):
             raise AssertionError(f"Unexpected upload URL: {request.url}")
-        parsed = urlparse(request.url)
-        body_params = {}
-        if request.body:
-            body_str = request.body.decode() if isinstance(request.body, bytes) else str(request.body)
-            body_params = parse_qs(body_str)
-        command = body_params.get("command")
-        if command is None:
-            command = parse_qs(parsed.query).get("command")
-        command_value = command[0].upper() if command else "APPEND"
-
-        if command_value == "INIT":
-            call_tracker["init"] += 1
-            return (
-                200,
-                {"Content-Type": "application/json"},
-                json.dumps(MEDIA_UPLOAD_VIDEO_INIT_RESPONSE),
-            )
-
-        if command_value == "APPEND":
-            call_tracker["append"] += 1
-            return  (
-                204,
-                {"Content-Type": "application/json"},
-                "",
-            )
-
-        if command_value == "FINALIZE":
-            call_tracker["finalize"] += 1
-            return (
-                200,
-                {"Content-Type": "application/json"},
-                json.dumps(finalize_payload),
-            )
-
-        raise AssertionError(f"Unexpected command {command_value} in chunked upload flow")
-
-    # tweepy のチャンクアップロードは同一エンドポイントにクエリ文字列を付けてアクセスするため、
-    # 正規表現で URL をマッチさせてクエリの有無に関わらずフックする。
+        # ``command`` is a short leading form field; never scan a whole APPEND chunk.
+        head = (request.body or b"")[:256]
+        if isinstance(head, str):
+            head = head.encode()
+        match = _COMMAND_RE.search(head) or _COMMAND_RE.search(request.url.encode())
+        command_value = match.group(1).decode().upper() if match else "APPEND"
+
+        resp = resp_by_command.get(command_value)
+        if resp is None:
+            raise AssertionError(f"Unexpected command {command_value} in chunked upload flow")
+        call_tracker[command_value.lower()] += 1
+        return resp
+
+    # tweepy のチャンクアップロードは同一エンドポイントにクエリ文字列を付けてアクセスするが、
+    # responses は文字列 URL の照合でクエリを無視するため、正規表現なしでフックできる。
     responses.add_callback(
         responses.POST,
-        UPLOAD_ENDPOINT_PATTERN,
+        UPLOAD_ENDPOINT,
         callback=upload_callback,
         content_type="application/json",
     )
 
-    def status_callback(request: responses.Call) -> tuple[int, dict[str, str], str]:
+    def status_callback(request: responses.Call) -> tuple[int, dict[str, str], bytes]:
+        nonlocal status_index
         if not request.url.startswith(UPLOAD_ENDPOINT):
             raise AssertionError(f"Unexpected status URL: {request.url}")
         call_tracker["status"] += 1
-        if not status_queue:
-            # Repeat last known status if polling exceeds provided sequence
-            payload = status_sequence[-1] if status_sequence else MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED
-        else:
-            payload = status_queue.popleft()
+        body = status_bodies[status_index]
+        status_index = min(status_index + 1, last_status)
         return (
             200,
-            {"Content-Type": "application/json"},
-            json.dumps(payload),
+            _JSON_HDR,
+            body,
         )
 
     responses.add_callback(
         responses.GET,
-        UPLOAD_ENDPOINT_PATTERN,
+        UPLOAD_ENDPOINT,
         callback=status_callback,
         content_type="application/json",
     )
@@ -120,47 +131,28 @@ def _register_chunked_video_flow(
     return call_tracker
 
 
-@pytest.fixture
-def credentials() -> XCredentials:
-    """Provide test credentials."""
-    return XCredentials(
-        api_key="test_api_key",
-        api_secret="test_api_secret",
-        access_token="test_access_token",
-        access_token_secret="test_access_token_secret",
-        bearer_token="test_bearer_token",
-    )
+@pytest.fixture(scope="session")
+def client(credentials: XCredentials) -> RateLimitedClient:
+    """Build the client once; ``responses`` patches the transport per test."""
+    return XClientFactory.create_from_credentials(credentials)
 
 
 @pytest.fixture
-def mock_image_file(tmp_path: Path) -> Path:
-    """Create a temporary PNG file for testing."""
-    file_path = tmp_path / "test_image.png"
-    file_path.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\0" * 100)  # Valid PNG header + data
-    return file_path
+def media_service_factory(client: RateLimitedClient) -> Callable[..., MediaService]:
+    """Build MediaService instances that never sleep and poll immediately."""
 
+    def build(*, timeout: float = 10) -> MediaService:
+        return MediaService(client, poll_interval=0, timeout=timeout, sleep=lambda _: None)
 
-@pytest.fixture
-def mock_video_file(tmp_path: Path) -> Path:
-    """Create a temporary MP4 file for testing."""
-    file_path = tmp_path / "test_video.mp4"
-    file_path.write_bytes(b"\0" * 1024)  # Small video data
-    return file_path
+    return build
 
 
 @responses.activate
-def test_create_post_with_real_http_mocking(credentials: XCredentials) -> None:
+def test_create_post_with_real_http_mocking(client: RateLimitedClient) -> None:
     """Integration: Create post with actual HTTP request mocking."""
     # Mock Twitter API v2 endpoint
-    responses.add(
-        responses.POST,
-        "https://api.twitter.com/2/tweets",
-        json=TWEET_RESPONSE,
-        status=201,
-    )
+    _register_all(_TWEET_REG)
 
-    # Create client and service
-    client = XClientFactory.create_from_credentials(credentials)
     post_service = PostService(client)
 
     # Create post
@@ -177,21 +169,14 @@ def test_create_post_with_real_http_mocking(credentials: XCredentials) -> None:
 
 @responses.activate
 def test_upload_image_with_http_mocking(
-    credentials: XCredentials,
+    media_service_factory: Callable[..., MediaService],
     mock_image_file: Path,
 ) -> None:
     """Integration: Upload image with HTTP request mocking."""
     # Mock Twitter API v1.1 media upload endpoint
-    responses.add(
-        responses.POST,
-        "https://upload.twitter.com/1.1/media/upload.json",
-        json=MEDIA_UPLOAD_IMAGE_RESPONSE,
-        status=200,
-    )
+    _register_all(_IMAGE_UPLOAD_REG)
 
-    # Create client and service
-    client = XClientFactory.create_from_credentials(credentials)
-    media_service = MediaService(client)
+    media_service = media_service_factory()
 
     # Upload image
     result = media_service.upload_image(mock_image_file)
@@ -206,7 +191,7 @@ def test_upload_image_with_http_mocking(
 
 @responses.activate
 def test_upload_video_with_chunked_upload_mocking(
-    credentials: XCredentials,
+    media_service_factory: Callable[..., MediaService],
     mock_video_file: Path,
 ) -> None:
     """Integration: Upload video with chunked upload HTTP mocking."""
@@ -215,9 +200,7 @@ def test_upload_video_with_chunked_upload_mocking(
         status_sequence=[MEDIA_UPLOAD_VIDEO_STATUS_PROCESSING, MEDIA_UPLOAD_VIDEO_STATUS_SUCCEEDED],
     )
 
-    # Create client and service with minimal polling delay
-    client = XClientFactory.create_from_credentials(credentials)
-    media_service = MediaService(client, poll_interval=0, timeout=10, sleep=lambda _: None)
+    media_service = media_service_factory()
 
     # Upload video
     result = media_service.upload_video(mock_video_file)
@@ -240,7 +223,7 @@ def test_upload_video_with_chunked_upload_mocking(
 
 @responses.activate
 def test_upload_video_timeout_with_http_mocking(
-    credentials: XCredentials,
+    media_service_factory: Callable[..., MediaService],
     mock_video_file: Path,
 ) -> None:
     """Integration: MediaService raises timeout when processing never completes."""
@@ -249,8 +232,7 @@ def test_upload_video_timeout_with_http_mocking(
         status_sequence=[MEDIA_UPLOAD_VIDEO_STATUS_PROCESSING],
     )
 
-    client = XClientFactory.create_from_credentials(credentials)
-    media_service = MediaService(client, poll_interval=0, timeout=0.5, sleep=lambda _: None)
+    media_service = media_service_factory(timeout=0.5)
 
     with pytest.raises(MediaProcessingTimeout):
         media_service.upload_video(mock_video_file)
@@ -258,7 +240,7 @@ def test_upload_video_timeout_with_http_mocking(
 
 @responses.activate
 def test_upload_video_failure_with_http_mocking(
-    credentials: XCredentials,
+    media_service_factory: Callable[..., MediaService],
     mock_video_file: Path,
 ) -> None:
     """Integration: MediaService raises exception when processing reports failure."""
@@ -268,8 +250,7 @@ def test_upload_video_failure_with_http_mocking(
         finalize_response=MEDIA_UPLOAD_VIDEO_FINALIZE_RESPONSE,
     )
 
-    client = XClientFactory.create_from_credentials(credentials)
-    media_service = MediaService(client, poll_interval=0, timeout=5, sleep=lambda _: None)
+    media_service = media_service_factory(timeout=5)
 
     with pytest.raises(MediaProcessingFailed):
         media_service.upload_video(mock_video_file)
@@ -277,17 +258,13 @@ def test_upload_video_failure_with_http_mocking(
 
 @responses.activate
 def test_end_to_end_post_with_image(
-    credentials: XCredentials,
+    client: RateLimitedClient,
+    media_service_factory: Callable[..., MediaService],
     mock_image_file: Path,
 ) -> None:
     """Integration: End-to-end post creation with image upload."""
     # Mock media upload
-    responses.add(
-        responses.POST,
-        "https://upload.twitter.com/1.1/media/upload.json",
-        json=MEDIA_UPLOAD_IMAGE_RESPONSE,
-        status=200,
-    )
+    _register_all(_IMAGE_UPLOAD_REG)
 
     # Mock post creation
     post_response_with_media = {
@@ -304,9 +281,7 @@ def test_end_to_end_post_with_image(
         status=201,
     )
 
-    # Create services
-    client = XClientFactory.create_from_credentials(credentials)
-    media_service = MediaService(client)
+    media_service = media_service_factory()
     post_service = PostService(client)
 
     # Upload image
@@ -325,32 +300,21 @@ def test_end_to_end_post_with_image(
 
 
 @responses.activate
-def test_factory_initialization_with_config(tmp_path: Path) -> None:
+def test_factory_initialization_with_config() -> None:
     """Integration: Factory creates client from ConfigManager with HTTP mocking."""
-    # Create dotenv file
-    config_file = tmp_path / ".env"
-    config_file.write_text(
-        "\n".join(
-            [
-                "X_API_KEY=test_key",
-                "X_API_SECRET=test_secret",
-                "X_ACCESS_TOKEN=test_token",
-                "X_ACCESS_TOKEN_SECRET=test_token_secret",
-                "X_BEARER_TOKEN=test_bearer",
-            ]
-        )
-    )
-
     # Mock API call
-    responses.add(
-        responses.POST,
-        "https://api.twitter.com/2/tweets",
-        json=TWEET_RESPONSE,
-        status=201,
+    _register_all(_TWEET_REG)
+
+    # Load config from an in-memory env mapping (no .env file I/O) and create client
+    config = ConfigManager(
+        env={
+            "X_API_KEY": "test_key",
+            "X_API_SECRET": "test_secret",
+            "X_ACCESS_TOKEN": "test_token",
+            "X_ACCESS_TOKEN_SECRET": "test_token_secret",
+            "X_BEARER_TOKEN": "test_bearer",
+        }
     )
-
-    # Load config and create client
-    config = ConfigManager(dotenv_path=config_file)
     client = XClientFactory.create_from_config(config)
     post_service = PostService(client)
 
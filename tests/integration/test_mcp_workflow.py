@@ -18,11 +18,19 @@ from x_client.config import ConfigManager
 from x_client.factory import XClientFactory
 from x_client.integrations.mcp_adapter import XMCPAdapter
 
+from .fixtures import (
+    RATE_LIMIT_HEADERS,
+    RATE_LIMIT_V2_ERROR_RESPONSE,
+    UNAUTHORIZED_ERROR_RESPONSE,
+)
 
-@pytest.fixture
-def test_credentials(tmp_path):
-    """Create test credentials in temporary .env file."""
-    env_file = tmp_path / ".env"
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="session")
+def test_credentials(tmp_path_factory):
+    """Create test credentials in a temporary .env file once per session."""
+    env_file = tmp_path_factory.mktemp("config") / ".env"
     env_file.write_text(
         """
 X_API_KEY=test_api_key
@@ -35,23 +43,49 @@ X_BEARER_TOKEN=test_bearer_token
     return env_file
 
 
-@pytest.fixture
-def adapter(test_credentials):
-    """Create MCP adapter with test configuration."""
-    config = ConfigManager(dotenv_path=test_credentials)
+@pytest.fixture(scope="session")
+def config(test_credentials):
+    """Parse the test .env once for all workflows."""
+    return ConfigManager(dotenv_path=test_credentials)
+
+
+@pytest.fixture(scope="session")
+def client(config):
+    """Build the X client once; responses patches the transport per test."""
     client = XClientFactory.create_from_config(config)
+    # Keep the default retry policy, but don't actually wait between 429 retries
+    client._handler.sleep = lambda _: None
+    return client
 
+
+@pytest.fixture
+def adapter(config, client):
+    """Create MCP adapter with fresh services around the shared client."""
     from x_client.services.media_service import MediaService
     from x_client.services.post_service import PostService
 
-    post_service = PostService(client)
-    media_service = MediaService(client)
+    # The client is shared, so drop rate-limit state left by a previous test
+    client._handler._last_rate_limit = None
 
     return XMCPAdapter(
         config=config,
-        post_service=post_service,
-        media_service=media_service,
+        post_service=PostService(client),
+        media_service=MediaService(client),
+    )
+
+
+@pytest.fixture(scope="session")
+def tool_schemas(config, client):
+    """Tool schemas are static pydantic output, so generate them once."""
+    from x_client.services.media_service import MediaService
+    from x_client.services.post_service import PostService
+
+    adapter = XMCPAdapter(
+        config=config,
+        post_service=PostService(client),
+        media_service=MediaService(client),
     )
+    return adapter.get_tool_schemas()
 
 
 # ============================================================================
@@ -356,18 +390,9 @@ def test_rate_limit_error_workflow(adapter):
     # Mock rate limit response (429)
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "errors": [
-                {
-                    "message": "Rate limit exceeded",
-                    "type": "about:blank",
-                }
-            ]
-        },
+        json=RATE_LIMIT_V2_ERROR_RESPONSE,
         status=429,
-        headers={
-            "x-rate-limit-reset": "1728730800",
-        },
+        headers=RATE_LIMIT_HEADERS,
     )
 
     request = {"text": "This will hit rate limit"}
@@ -385,14 +410,7 @@ def test_authentication_error_workflow(adapter):
     # Mock authentication error (401)
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "errors": [
-                {
-                    "message": "Unauthorized",
-                    "type": "about:blank",
-                }
-            ]
-        },
+        json=UNAUTHORIZED_ERROR_RESPONSE,
         status=401,
     )
 
@@ -409,24 +427,25 @@ def test_authentication_error_workflow(adapter):
 # ============================================================================
 
 
-def test_tool_schemas_workflow(adapter):
-    """Test retrieving all tool schemas for MCP registration."""
-    schemas = adapter.get_tool_schemas()
+_REQUIRED_SCHEMA_KEYS = frozenset({"description", "input_schema", "output_schema"})
+
+
+def _is_object_schema(schema):
+    """Return True if a JSON Schema describes an object."""
+    return "properties" in schema or schema.get("type") == "object"
 
+
+def test_tool_schemas_workflow(tool_schemas):
+    """Test retrieving all tool schemas for MCP registration."""
     # Verify all tools have proper schema structure
-    for tool_name, schema in schemas.items():
-        assert "description" in schema
-        assert "input_schema" in schema
-        assert "output_schema" in schema
+    for schema in tool_schemas.values():
+        assert _REQUIRED_SCHEMA_KEYS <= schema.keys()
 
         # Verify JSON Schema structure
-        input_schema = schema["input_schema"]
-        assert "properties" in input_schema or input_schema.get("type") == "object"
-
-        output_schema = schema["output_schema"]
-        assert "properties" in output_schema or output_schema.get("type") == "object"
+        assert _is_object_schema(schema["input_schema"])
+        assert _is_object_schema(schema["output_schema"])
 
     # Verify specific tool
-    create_post = schemas["create_post"]
+    create_post = tool_schemas["create_post"]
     assert "text" in create_post["input_schema"]["properties"]
     assert "Post" in create_post["description"] or "post" in create_post["description"]
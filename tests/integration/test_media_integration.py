@@ -13,7 +13,12 @@ from x_client.factory import XClientFactory
 from x_client.services.media_service import MediaService
 
 
-@pytest.fixture
+REQUIRED_MEDIA_SERVICE_METHODS = frozenset(
+    {"upload_image", "upload_video", "_upload", "_await_processing"}
+)
+
+
+@pytest.fixture(scope="session")
 def credentials() -> XCredentials:
     """Provide valid test credentials."""
     return XCredentials(
@@ -24,7 +29,7 @@ def credentials() -> XCredentials:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(credentials: XCredentials) -> TweepyClient:
     """Create TweepyClient with test credentials."""
     return XClientFactory.create_from_credentials(credentials)
@@ -37,8 +42,9 @@ def media_service(client: TweepyClient) -> MediaService:
 
 
 def _write_file(path: Path, size: int) -> None:
-    """Helper to create test files."""
-    path.write_bytes(b"\0" * size)
+    """Helper to create test files (sparse, so large sizes cost no real I/O)."""
+    with path.open("wb") as handle:
+        handle.truncate(size)
 
 
 def test_media_service_initialization(credentials: XCredentials) -> None:
@@ -53,39 +59,32 @@ def test_media_service_initialization(credentials: XCredentials) -> None:
 
 def test_media_service_has_upload_methods(media_service: MediaService) -> None:
     """Integration: MediaService exposes upload methods."""
-    assert hasattr(media_service, "upload_image")
-    assert hasattr(media_service, "upload_video")
-    assert hasattr(media_service, "_upload")
-    assert hasattr(media_service, "_await_processing")
-
-
-def test_upload_image_size_validation(media_service: MediaService, tmp_path: Path) -> None:
-    """Integration test: Image size validation."""
-    large_image = tmp_path / "large.png"
-    _write_file(large_image, 6 * 1024 * 1024)  # 6MB > 5MB limit
-
-    with pytest.raises(MediaValidationError) as exc_info:
-        media_service.upload_image(large_image)
-
-    assert "exceeds" in str(exc_info.value)
-
-
-def test_upload_unsupported_mime_type(media_service: MediaService, tmp_path: Path) -> None:
-    """Integration test: Unsupported MIME type validation."""
-    bad_file = tmp_path / "test.bmp"
-    _write_file(bad_file, 1024)
-
-    with pytest.raises(MediaValidationError) as exc_info:
-        media_service.upload_image(bad_file)
-
-    assert "Unsupported" in str(exc_info.value)
-
-
-def test_upload_nonexistent_file(media_service: MediaService, tmp_path: Path) -> None:
-    """Integration test: File existence validation."""
-    nonexistent = tmp_path / "nonexistent.png"
+    missing = REQUIRED_MEDIA_SERVICE_METHODS - set(dir(media_service))
+    assert not missing, f"MediaService is missing methods: {sorted(missing)}"
+
+
+@pytest.mark.parametrize(
+    ("filename", "size", "expected_message"),
+    [
+        ("large.png", 6 * 1024 * 1024, "exceeds"),  # 6MB > 5MB limit
+        ("test.bmp", 1024, "Unsupported"),  # Unsupported MIME type
+        ("nonexistent.png", None, "does not exist"),  # File is never created
+    ],
+    ids=["size_limit", "unsupported_mime_type", "nonexistent_file"],
+)
+def test_upload_image_validation_errors(
+    media_service: MediaService,
+    tmp_path: Path,
+    filename: str,
+    size: int | None,
+    expected_message: str,
+) -> None:
+    """Integration test: Image validation rejects bad files before any upload."""
+    path = tmp_path / filename
+    if size is not None:
+        _write_file(path, size)
 
     with pytest.raises(MediaValidationError) as exc_info:
-        media_service.upload_image(nonexistent)
+        media_service.upload_image(path)
 
-    assert "does not exist" in str(exc_info.value)
+    assert expected_message in str(exc_info.value)
@@ -12,6 +12,20 @@ from x_client.factory import XClientFactory
 from x_client.services.post_service import PostService
 
 
+REQUIRED_CLIENT_METHODS = frozenset(
+    {
+        # Post operations (v2)
+        "create_post",
+        "delete_post",
+        "get_post",
+        "search_recent_posts",
+        # Media operations (v1.1)
+        "upload_media",
+        "get_media_upload_status",
+    }
+)
+
+
 class _RecordingV2Client:
     """Stub for tweepy.Client that records interactions."""
 
@@ -46,21 +60,43 @@ class _RecordingV1API:
     pass
 
 
-@pytest.fixture
-def credentials() -> XCredentials:
-    """Provide valid test credentials."""
-    return XCredentials(
-        api_key="test_api_key",
-        api_secret="test_api_secret",
-        access_token="test_access_token",
-        access_token_secret="test_access_token_secret",
-        bearer_token="test_bearer_token",
-    )
+def _install_fake_tweepy(monkeypatch: pytest.MonkeyPatch) -> list[_RecordingV2Client]:
+    """Patch the tweepy constructors used by the factory with recording stubs."""
+    created_clients: list[_RecordingV2Client] = []
+
+    def fake_client_ctor(*_args, **_kwargs):
+        client = _RecordingV2Client()
+        created_clients.append(client)
+        return client
 
+    monkeypatch.setattr("x_client.factory.tweepy.Client", fake_client_ctor)
+    monkeypatch.setattr("x_client.factory.tweepy.OAuth1UserHandler", lambda *a, **k: object())
+    monkeypatch.setattr("x_client.factory.tweepy.API", lambda _auth: _RecordingV1API())
+    return created_clients
 
-def test_factory_creates_client_with_both_apis(credentials: XCredentials) -> None:
+
+@pytest.fixture(autouse=True)
+def fake_tweepy(monkeypatch: pytest.MonkeyPatch) -> list[_RecordingV2Client]:
+    """Replace tweepy constructors used by the factory with recording stubs.
+
+    Autouse: tests here only check wiring, so no real tweepy.Client/API (and
+    their requests sessions) is ever built. Returns the stub v2 clients
+    created, in construction order.
+    """
+    return _install_fake_tweepy(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def built_client(credentials: XCredentials) -> RateLimitedClient:
+    """Factory client built once for the tests that only inspect its wiring."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _install_fake_tweepy(monkeypatch)
+        return XClientFactory.create_from_credentials(credentials)
+
+
+def test_factory_creates_client_with_both_apis(built_client: RateLimitedClient) -> None:
     """Integration: Factory creates RateLimitedClient wrapping TweepyClient with v2 and v1.1 APIs."""
-    client = XClientFactory.create_from_credentials(credentials)
+    client = built_client
 
     # By default, factory wraps with RateLimitedClient
     assert isinstance(client, RateLimitedClient)
@@ -68,8 +104,7 @@ def test_factory_creates_client_with_both_apis(credentials: XCredentials) -> Non
     # Unwrap to check underlying TweepyClient
     unwrapped = client._client
     assert isinstance(unwrapped, TweepyClient)
-    assert hasattr(unwrapped, "_client")  # v2 client
-    assert hasattr(unwrapped, "_api")  # v1.1 API
+    assert {"_client", "_api"} <= set(dir(unwrapped))  # v2 client, v1.1 API
     assert unwrapped._client is not None
     assert unwrapped._api is not None
 
@@ -87,40 +122,23 @@ def test_factory_validates_missing_credentials() -> None:
         XClientFactory.create_from_credentials(incomplete_credentials)
 
 
-def test_service_layer_initialization(credentials: XCredentials) -> None:
+def test_service_layer_initialization(built_client: RateLimitedClient) -> None:
     """Integration: Service layer properly initializes with factory client."""
-    client = XClientFactory.create_from_credentials(credentials)
-    post_service = PostService(client)
+    post_service = PostService(built_client)
 
-    assert post_service.client is client
-    assert hasattr(post_service, "create_post")
-    assert hasattr(post_service, "delete_post")
+    assert post_service.client is built_client
+    assert {"create_post", "delete_post"} <= set(dir(post_service))
 
 
-def test_client_has_all_required_methods(credentials: XCredentials) -> None:
+def test_client_has_all_required_methods(built_client: RateLimitedClient) -> None:
     """Integration: Client exposes all required methods for services."""
-    client = XClientFactory.create_from_credentials(credentials)
-
-    # Post operations (v2)
-    assert hasattr(client, "create_post")
-    assert hasattr(client, "delete_post")
-    assert hasattr(client, "get_post")
-    assert hasattr(client, "search_recent_posts")
-
-    # Media operations (v1.1)
-    assert hasattr(client, "upload_media")
-    assert hasattr(client, "get_media_upload_status")
+    missing = REQUIRED_CLIENT_METHODS - set(dir(built_client))
+    assert not missing, f"client is missing methods: {sorted(missing)}"
 
 
 def test_bearer_token_optional_for_v1_operations(credentials: XCredentials) -> None:
     """Integration: Bearer token not required for v1.1-only operations."""
-    credentials_without_bearer = XCredentials(
-        api_key="test_key",
-        api_secret="test_secret",
-        access_token="test_token",
-        access_token_secret="test_token_secret",
-        bearer_token=None,  # Optional
-    )
+    credentials_without_bearer = credentials.model_copy(update={"bearer_token": None})
 
     client = XClientFactory.create_from_credentials(credentials_without_bearer)
 
@@ -130,22 +148,11 @@ def test_bearer_token_optional_for_v1_operations(credentials: XCredentials) -> N
 
 
 def test_create_thread_via_factory_uses_reply_chain(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_tweepy: list[_RecordingV2Client],
     credentials: XCredentials,
 ) -> None:
     """Integration: create_thread issues sequential replies via Tweepy client wrappers."""
 
-    created_clients: list[_RecordingV2Client] = []
-
-    def fake_client_ctor(*_args, **_kwargs):
-        client = _RecordingV2Client()
-        created_clients.append(client)
-        return client
-
-    monkeypatch.setattr("x_client.factory.tweepy.Client", fake_client_ctor)
-    monkeypatch.setattr("x_client.factory.tweepy.OAuth1UserHandler", lambda *a, **k: object())
-    monkeypatch.setattr("x_client.factory.tweepy.API", lambda _auth: _RecordingV1API())
-
     client = XClientFactory.create_from_credentials(credentials, enable_rate_limiting=False)
     assert isinstance(client, TweepyClient)
 
@@ -155,7 +162,7 @@ def test_create_thread_via_factory_uses_reply_chain(
     assert result.succeeded is True
     assert len(result.posts) >= 2  # 長文なので複数セグメントになる
 
-    fake_client = created_clients[0]
+    fake_client = fake_tweepy[0]
     assert len(fake_client.create_calls) == len(result.posts)
 
     # 最初の投稿は reply 指定なし、その後は直前の ID に返信する
@@ -168,22 +175,11 @@ def test_create_thread_via_factory_uses_reply_chain(
 
 
 def test_repost_and_undo_flow_via_factory(
-    monkeypatch: pytest.MonkeyPatch,
+    fake_tweepy: list[_RecordingV2Client],
     credentials: XCredentials,
 ) -> None:
     """Integration: repost/undo_repost calls tweepy client with user_auth flag."""
 
-    created_clients: list[_RecordingV2Client] = []
-
-    def fake_client_ctor(*_args, **_kwargs):
-        client = _RecordingV2Client()
-        created_clients.append(client)
-        return client
-
-    monkeypatch.setattr("x_client.factory.tweepy.Client", fake_client_ctor)
-    monkeypatch.setattr("x_client.factory.tweepy.OAuth1UserHandler", lambda *a, **k: object())
-    monkeypatch.setattr("x_client.factory.tweepy.API", lambda _auth: _RecordingV1API())
-
     client = XClientFactory.create_from_credentials(credentials, enable_rate_limiting=False)
     assert isinstance(client, TweepyClient)
     service = PostService(client)
@@ -194,6 +190,6 @@ def test_repost_and_undo_flow_via_factory(
     undo_result = service.undo_repost("555")
     assert undo_result.reposted is False
 
-    fake_client = created_clients[0]
+    fake_client = fake_tweepy[0]
     assert fake_client.retweet_calls == [{"tweet_id": "555", "user_auth": True}]
     assert fake_client.unretweet_calls == [{"tweet_id": "555", "user_auth": True}]
@@ -21,11 +21,20 @@ from x_client.factory import XClientFactory
 from x_client.rate_limit import RetryConfig
 from x_client.services.post_service import PostService
 
+from .fixtures import (
+    RATE_LIMIT_HEADERS,
+    RATE_LIMIT_V2_ERROR_RESPONSE,
+    TWEET_SUCCESS_RESPONSE,
+    UNAUTHORIZED_ERROR_RESPONSE,
+)
 
-@pytest.fixture
-def test_credentials(tmp_path):
-    """Create test credentials in temporary .env file."""
-    env_file = tmp_path / ".env"
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(scope="session")
+def test_credentials(tmp_path_factory):
+    """Create test credentials in a temporary .env file once per session."""
+    env_file = tmp_path_factory.mktemp("config") / ".env"
     env_file.write_text(
         """
 X_API_KEY=test_api_key
@@ -38,24 +47,47 @@ X_BEARER_TOKEN=test_bearer_token
     return env_file
 
 
-@pytest.fixture
-def rate_limited_client(test_credentials):
-    """Create rate-limited client with test configuration."""
-    config = ConfigManager(dotenv_path=test_credentials)
+@pytest.fixture(scope="session")
+def sample_png(tmp_path_factory):
+    """Write the minimal PNG payload once per session; uploads only read it."""
+    image_file = tmp_path_factory.mktemp("media") / "test.png"
+    image_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
+    return image_file
+
+
+@pytest.fixture(scope="session")
+def config_manager(test_credentials):
+    """Parse the test .env once; ConfigManager is read-only in these tests."""
+    return ConfigManager(dotenv_path=test_credentials)
+
 
-    # Use aggressive retry settings for faster tests
+@pytest.fixture(scope="session")
+def _rate_limited_client_template(config_manager):
+    """Build the rate-limited client once per session."""
+
+    # Zero backoff and no jitter: retry logic runs, but no test ever waits
     retry_config = RetryConfig(
         max_retries=2,
-        base_delay=0.01,  # 10ms base delay
-        max_delay=0.1,  # 100ms max delay
+        base_delay=0.0,
+        max_delay=0.0,
         jitter=False,  # Disable jitter for predictable tests
     )
 
-    return XClientFactory.create_from_config(
-        config,
+    client = XClientFactory.create_from_config(
+        config_manager,
         enable_rate_limiting=True,
         retry_config=retry_config,
     )
+    # Never block on time.sleep, even for reset-based waits
+    client._handler.sleep = lambda _: None
+    return client
+
+
+@pytest.fixture
+def rate_limited_client(_rate_limited_client_template):
+    """Shared rate-limited client with rate limit state cleared for each test."""
+    _rate_limited_client_template._handler._last_rate_limit = None
+    return _rate_limited_client_template
 
 
 # ============================================================================
@@ -69,29 +101,15 @@ def test_rate_limit_retry_success(rate_limited_client):
     # First request returns 429
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "errors": [
-                {
-                    "message": "Rate limit exceeded",
-                    "type": "about:blank",
-                }
-            ]
-        },
+        json=RATE_LIMIT_V2_ERROR_RESPONSE,
         status=429,
-        headers={
-            "x-rate-limit-reset": "1728730800",
-        },
+        headers=RATE_LIMIT_HEADERS,
     )
 
     # Second request succeeds
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "data": {
-                "id": "1234567890",
-                "text": "Test post",
-            }
-        },
+        json=TWEET_SUCCESS_RESPONSE,
         status=201,
     )
 
@@ -109,23 +127,13 @@ def test_rate_limit_retry_success(rate_limited_client):
 @responses.activate
 def test_rate_limit_retry_exhausted(rate_limited_client):
     """Test retry exhaustion with persistent rate limit errors."""
-    # All requests return 429
-    for _ in range(5):  # More than max_retries
-        responses.post(
-            "https://api.twitter.com/2/tweets",
-            json={
-                "errors": [
-                    {
-                        "message": "Rate limit exceeded",
-                        "type": "about:blank",
-                    }
-                ]
-            },
-            status=429,
-            headers={
-                "x-rate-limit-reset": "1728730800",
-            },
-        )
+    # All requests return 429 (responses keeps serving the last remaining match)
+    responses.post(
+        "https://api.twitter.com/2/tweets",
+        json=RATE_LIMIT_V2_ERROR_RESPONSE,
+        status=429,
+        headers=RATE_LIMIT_HEADERS,
+    )
 
     # Create service with rate-limited client
     service = PostService(rate_limited_client)
@@ -144,14 +152,7 @@ def test_rate_limit_no_retry_on_other_errors(rate_limited_client):
     # Request returns 401 unauthorized
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "errors": [
-                {
-                    "message": "Unauthorized",
-                    "type": "about:blank",
-                }
-            ]
-        },
+        json=UNAUTHORIZED_ERROR_RESPONSE,
         status=401,
     )
 
@@ -174,12 +175,8 @@ def test_rate_limit_no_retry_on_other_errors(rate_limited_client):
 
 
 @responses.activate
-def test_media_upload_rate_limit_retry(rate_limited_client, tmp_path):
+def test_media_upload_rate_limit_retry(rate_limited_client, sample_png):
     """Test media upload with rate limit retry."""
-    # Create test image
-    image_file = tmp_path / "test.png"
-    image_file.write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 100)
-
     # First upload returns 429
     responses.post(
         "https://upload.twitter.com/1.1/media/upload.json",
@@ -192,9 +189,7 @@ def test_media_upload_rate_limit_retry(rate_limited_client, tmp_path):
             ]
         },
         status=429,
-        headers={
-            "x-rate-limit-reset": "1728730800",
-        },
+        headers=RATE_LIMIT_HEADERS,
     )
 
     # Second upload succeeds
@@ -213,7 +208,7 @@ def test_media_upload_rate_limit_retry(rate_limited_client, tmp_path):
     media_service = MediaService(rate_limited_client)
 
     # Should succeed after retry
-    result = media_service.upload_image(image_file)
+    result = media_service.upload_image(sample_png)
 
     assert result.media_id == "123456789"
     assert len(responses.calls) == 2  # Initial + 1 retry
@@ -224,35 +219,29 @@ def test_media_upload_rate_limit_retry(rate_limited_client, tmp_path):
 # ============================================================================
 
 
-def test_factory_creates_rate_limited_client_by_default(test_credentials):
-    """Test that factory creates rate-limited client by default."""
-    config = ConfigManager(dotenv_path=test_credentials)
-    client = XClientFactory.create_from_config(config)
+@pytest.mark.parametrize(
+    ("factory_kwargs", "expected_type", "unexpected_type"),
+    [
+        ({}, RateLimitedClient, None),  # Wrapped by default
+        ({"enable_rate_limiting": False}, TweepyClient, RateLimitedClient),
+    ],
+    ids=["rate_limited_by_default", "rate_limiting_disabled"],
+)
+def test_factory_rate_limit_wrapping(config_manager, factory_kwargs, expected_type, unexpected_type):
+    """Test that factory wraps with RateLimitedClient unless disabled."""
+    client = XClientFactory.create_from_config(config_manager, **factory_kwargs)
 
-    # Should be wrapped with RateLimitedClient
-    assert isinstance(client, RateLimitedClient)
+    assert isinstance(client, expected_type)
+    if unexpected_type is not None:
+        assert not isinstance(client, unexpected_type)
 
-    # Should have rate limit info getter
-    assert hasattr(client, "get_rate_limit_info")
+    if expected_type is RateLimitedClient:
+        # Should have rate limit info getter
+        assert hasattr(client, "get_rate_limit_info")
 
 
-def test_factory_can_disable_rate_limiting(test_credentials):
-    """Test that factory can create unwrapped client."""
-    config = ConfigManager(dotenv_path=test_credentials)
-    client = XClientFactory.create_from_config(
-        config,
-        enable_rate_limiting=False,
-    )
-
-    # Should be TweepyClient without wrapper
-    assert isinstance(client, TweepyClient)
-    assert not isinstance(client, RateLimitedClient)
-
-
-def test_factory_accepts_custom_retry_config(test_credentials):
+def test_factory_accepts_custom_retry_config(config_manager):
     """Test that factory accepts custom retry configuration."""
-    config = ConfigManager(dotenv_path=test_credentials)
-
     custom_config = RetryConfig(
         max_retries=5,
         base_delay=2.0,
@@ -260,7 +249,7 @@ def test_factory_accepts_custom_retry_config(test_credentials):
     )
 
     client = XClientFactory.create_from_config(
-        config,
+        config_manager,
         enable_rate_limiting=True,
         retry_config=custom_config,
     )
@@ -282,12 +271,7 @@ def test_rate_limit_info_tracking(rate_limited_client):
     # Mock successful request with rate limit headers
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "data": {
-                "id": "1234567890",
-                "text": "Test post",
-            }
-        },
+        json=TWEET_SUCCESS_RESPONSE,
         status=201,
         headers={
             "x-rate-limit-limit": "300",
@@ -315,14 +299,7 @@ def test_rate_limit_info_from_exception(rate_limited_client):
     # Mock rate limit error
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "errors": [
-                {
-                    "message": "Rate limit exceeded",
-                    "type": "about:blank",
-                }
-            ]
-        },
+        json=RATE_LIMIT_V2_ERROR_RESPONSE,
         status=429,
         headers={
             "x-rate-limit-limit": "300",
@@ -334,12 +311,7 @@ def test_rate_limit_info_from_exception(rate_limited_client):
     # Second request for retry
     responses.post(
         "https://api.twitter.com/2/tweets",
-        json={
-            "data": {
-                "id": "1234567890",
-                "text": "Test post",
-            }
-        },
+        json=TWEET_SUCCESS_RESPONSE,
         status=201,
     )
 
@@ -0,0 +1,61 @@
+"""Shared fixtures for unit tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock, NonCallableMock
+
+import pytest
+
+from x_client.integrations.mcp_adapter import XMCPAdapter
+
+
+@pytest.fixture
+def missing_dotenv_path(tmp_path: Path) -> Path:
+    """A .env path that does not exist yet, isolated per test."""
+    return tmp_path / ".env"
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Mock ConfigManager."""
+    config = NonCallableMock()
+    config.load_credentials = Mock()
+    return config
+
+
+@pytest.fixture(scope="session")
+def mock_post_service():
+    """Mock PostService."""
+    service = NonCallableMock()
+    service.client = Mock()
+    return service
+
+
+@pytest.fixture(scope="session")
+def mock_media_service():
+    """Mock MediaService."""
+    return NonCallableMock()
+
+
+@pytest.fixture(scope="session")
+def adapter(mock_config, mock_post_service, mock_media_service):
+    """Create XMCPAdapter with mocked dependencies.
+
+    The adapter only stores its collaborators, so one instance is shared;
+    ``_reset_adapter_mocks`` clears the mocks between tests.
+    """
+    return XMCPAdapter(
+        config=mock_config,
+        post_service=mock_post_service,
+        media_service=mock_media_service,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_adapter_mocks(request: pytest.FixtureRequest):
+    """Clear calls, return values and side effects set by the previous test."""
+    yield
+    for name in ("mock_config", "mock_post_service", "mock_media_service"):
+        if name in request.fixturenames:
+            request.getfixturevalue(name).reset_mock(return_value=True, side_effect=True)
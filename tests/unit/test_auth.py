@@ -25,14 +25,19 @@ class DummyOAuthHandler:
         return self.access_token
 
 
-def test_ensure_oauth1_token_returns_cached_tokens(tmp_path) -> None:
+class FailingHandler(DummyOAuthHandler):
+    def get_authorization_url(self) -> str:
+        raise tweepy.errors.TweepyException("boom")
+
+
+def test_ensure_oauth1_token_returns_cached_tokens(missing_dotenv_path) -> None:
     env = {
         "X_API_KEY": "api-key",
         "X_API_SECRET": "api-secret",
         "X_ACCESS_TOKEN": "cached-access",
         "X_ACCESS_TOKEN_SECRET": "cached-secret",
     }
-    manager = ConfigManager(env=env, dotenv_path=tmp_path / ".env")
+    manager = ConfigManager(env=env, dotenv_path=missing_dotenv_path)
     oauth = OAuthManager(manager)
 
     tokens = oauth.ensure_oauth1_token()
@@ -47,48 +52,37 @@ def test_start_oauth1_flow_persists_tokens(tmp_path) -> None:
     dotenv_path = tmp_path / ".env"
     manager = ConfigManager(env=env, dotenv_path=dotenv_path)
 
-    def factory(*args, **kwargs):
-        return DummyOAuthHandler(*args, **kwargs)
-
     def callback(url: str) -> str:
         assert "oauth" in url
         return "verifier-code"
 
-    oauth = OAuthManager(manager, callback_handler=callback, oauth_handler_factory=factory)  # type: ignore[arg-type]
+    oauth = OAuthManager(manager, callback_handler=callback, oauth_handler_factory=DummyOAuthHandler)  # type: ignore[arg-type]
     tokens = oauth.ensure_oauth1_token()
 
     assert tokens.access_token == "new-access-token"
-    data = dotenv_path.read_text(encoding="utf-8")
-    assert "new-access-secret" in data
+    assert b"new-access-secret" in dotenv_path.read_bytes()
 
 
-def test_start_oauth1_flow_raises_on_auth_failure(tmp_path) -> None:
+def test_start_oauth1_flow_raises_on_auth_failure(missing_dotenv_path) -> None:
     env = {
         "X_API_KEY": "api-key",
         "X_API_SECRET": "api-secret",
     }
-    manager = ConfigManager(env=env, dotenv_path=tmp_path / ".env")
-
-    class FailingHandler(DummyOAuthHandler):
-        def get_authorization_url(self) -> str:
-            raise tweepy.errors.TweepyException("boom")
-
-    def factory(*args, **kwargs):
-        return FailingHandler(*args, **kwargs)
+    manager = ConfigManager(env=env, dotenv_path=missing_dotenv_path)
 
-    oauth = OAuthManager(manager, callback_handler=lambda _: "code", oauth_handler_factory=factory)  # type: ignore[arg-type]
+    oauth = OAuthManager(manager, callback_handler=lambda _: "code", oauth_handler_factory=FailingHandler)  # type: ignore[arg-type]
 
     with pytest.raises(AuthenticationError):
         oauth.start_oauth1_flow()
 
 
-def test_refresh_token_requires_callback(tmp_path) -> None:
+def test_refresh_token_requires_callback(missing_dotenv_path) -> None:
     manager = ConfigManager(
         env={
             "X_API_KEY": "api-key",
             "X_API_SECRET": "api-secret",
         },
-        dotenv_path=tmp_path / ".env",
+        dotenv_path=missing_dotenv_path,
     )
     oauth = OAuthManager(manager)
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -8,20 +9,30 @@ from x_client.config import ConfigManager, XCredentials
 from x_client.exceptions import ConfigurationError
 
 
-def test_load_credentials_prefers_environment(tmp_path: Path) -> None:
-    dotenv_file = tmp_path / ".env"
-    dotenv_file.write_text(
-        "\n".join(
-            [
-                "X_API_KEY=dotenv-key",
-                "X_API_SECRET=dotenv-secret",
-                "X_ACCESS_TOKEN=dotenv-access",
-                "X_ACCESS_TOKEN_SECRET=dotenv-secret-token",
-                "X_BEARER_TOKEN=dotenv-bearer",
-            ]
-        ),
-        encoding="utf-8",
-    )
+# .env payloads written verbatim by the tests below.
+_DOTENV_BYTES = (
+    b"X_API_KEY=dotenv-key\n"
+    b"X_API_SECRET=dotenv-secret\n"
+    b"X_ACCESS_TOKEN=dotenv-access\n"
+    b"X_ACCESS_TOKEN_SECRET=dotenv-access-secret\n"
+    b"X_BEARER_TOKEN=dotenv-bearer"
+)
+_EXISTING_DOTENV_BYTES = (
+    b"# Existing credentials\n"
+    b"X_API_KEY=existing-key\n"
+    b"X_API_SECRET=existing-secret"
+)
+
+
+@pytest.fixture(scope="session")
+def prewritten_dotenv(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Write the canonical .env once; tests that use it only read it."""
+    dotenv_file = tmp_path_factory.mktemp("dotenv") / ".env"
+    dotenv_file.write_bytes(_DOTENV_BYTES)
+    return dotenv_file
+
+
+def test_load_credentials_prefers_environment(prewritten_dotenv: Path) -> None:
     env = {
         "X_API_KEY": "env-key",
         "X_API_SECRET": "env-secret",
@@ -30,38 +41,23 @@ def test_load_credentials_prefers_environment(tmp_path: Path) -> None:
         "X_BEARER_TOKEN": "env-bearer",
     }
 
-    manager = ConfigManager(env=env, dotenv_path=dotenv_file)
+    manager = ConfigManager(env=env, dotenv_path=prewritten_dotenv)
     credentials = manager.load_credentials()
 
     assert credentials.api_key == "env-key"
     assert credentials.access_token == "env-access"
 
 
-def test_load_credentials_from_dotenv(tmp_path: Path) -> None:
-    dotenv_file = tmp_path / ".env"
-    dotenv_file.write_text(
-        "\n".join(
-            [
-                "X_API_KEY=dotenv-key",
-                "X_API_SECRET=dotenv-secret",
-                "X_ACCESS_TOKEN=dotenv-access",
-                "X_ACCESS_TOKEN_SECRET=dotenv-access-secret",
-                "X_BEARER_TOKEN=dotenv-bearer",
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    manager = ConfigManager(env={}, dotenv_path=dotenv_file)
+def test_load_credentials_from_dotenv(prewritten_dotenv: Path) -> None:
+    manager = ConfigManager(env={}, dotenv_path=prewritten_dotenv)
     credentials = manager.load_credentials(priority=("dotenv",))
 
     assert credentials.api_key == "dotenv-key"
     assert credentials.access_token_secret == "dotenv-access-secret"
 
 
-def test_load_credentials_raises_when_missing(tmp_path: Path) -> None:
-    dotenv_file = tmp_path / ".env"
-    manager = ConfigManager(env={}, dotenv_path=dotenv_file)
+def test_load_credentials_raises_when_missing(missing_dotenv_path: Path) -> None:
+    manager = ConfigManager(env={}, dotenv_path=missing_dotenv_path)
 
     with pytest.raises(ConfigurationError):
         manager.load_credentials()
@@ -69,16 +65,7 @@ def test_load_credentials_raises_when_missing(tmp_path: Path) -> None:
 
 def test_save_credentials_updates_dotenv(tmp_path: Path) -> None:
     dotenv_file = tmp_path / ".env"
-    dotenv_file.write_text(
-        "\n".join(
-            [
-                "# Existing credentials",
-                "X_API_KEY=existing-key",
-                "X_API_SECRET=existing-secret",
-            ]
-        ),
-        encoding="utf-8",
-    )
+    dotenv_file.write_bytes(_EXISTING_DOTENV_BYTES)
     manager = ConfigManager(env={}, dotenv_path=dotenv_file)
 
     manager.save_credentials(
@@ -90,8 +77,57 @@ def test_save_credentials_updates_dotenv(tmp_path: Path) -> None:
         )
     )
 
-    contents = dotenv_file.read_text(encoding="utf-8")
-    assert "X_API_KEY=existing-key" in contents
-    assert "X_API_SECRET=existing-secret" in contents
-    assert "X_ACCESS_TOKEN=new-access" in contents
-    assert "X_ACCESS_TOKEN_SECRET=new-secret" in contents
+    contents = dotenv_file.read_bytes()
+    assert b"X_API_KEY=existing-key" in contents
+    assert b"X_API_SECRET=existing-secret" in contents
+    assert b"X_ACCESS_TOKEN=new-access" in contents
+    assert b"X_ACCESS_TOKEN_SECRET=new-secret" in contents
+
+
+def test_load_credentials_reparses_dotenv_only_when_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("X_API_KEY=first-key\n", encoding="utf-8")
+    manager = ConfigManager(env={}, dotenv_path=dotenv_file)
+
+    parse_calls = 0
+    original_parse = ConfigManager._parse_dotenv
+
+    def counting_parse(path: Path) -> XCredentials | None:
+        nonlocal parse_calls
+        parse_calls += 1
+        return original_parse(path)
+
+    monkeypatch.setattr(ConfigManager, "_parse_dotenv", staticmethod(counting_parse))
+
+    assert manager.load_credentials(priority=("dotenv",)).api_key == "first-key"
+    assert manager.load_credentials(priority=("dotenv",)).api_key == "first-key"
+    assert parse_calls == 1
+
+    dotenv_file.write_text("X_API_KEY=second-key-longer\n", encoding="utf-8")
+    assert manager.load_credentials(priority=("dotenv",)).api_key == "second-key-longer"
+    assert parse_calls == 2
+
+    manager.save_credentials(XCredentials(access_token="saved-access"))
+    credentials = manager.load_credentials(priority=("dotenv",))
+    assert credentials.api_key == "second-key-longer"
+    assert credentials.access_token == "saved-access"
+
+
+def test_load_credentials_reparses_same_size_replacement(tmp_path: Path) -> None:
+    dotenv_file = tmp_path / ".env"
+    dotenv_file.write_text("X_API_KEY=old-token\n", encoding="utf-8")
+    manager = ConfigManager(env={}, dotenv_path=dotenv_file)
+    assert manager.load_credentials(priority=("dotenv",)).api_key == "old-token"
+    original = dotenv_file.stat()
+
+    # Rotate the token atomically, keeping the size and the modification time.
+    replacement = tmp_path / ".env.new"
+    replacement.write_text("X_API_KEY=new-token\n", encoding="utf-8")
+    os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+    os.replace(replacement, dotenv_file)
+
+    assert dotenv_file.stat().st_size == original.st_size
+    assert dotenv_file.stat().st_mtime_ns == original.st_mtime_ns
+    assert manager.load_credentials(priority=("dotenv",)).api_key == "new-token"
@@ -9,9 +9,6 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import Mock, patch
-
-import pytest
 
 from x_client.exceptions import (
     ApiResponseError,
@@ -21,7 +18,6 @@ from x_client.exceptions import (
     MediaValidationError,
     RateLimitExceeded,
 )
-from x_client.integrations.mcp_adapter import XMCPAdapter
 from x_client.models import (
     MediaProcessingInfo,
     MediaUploadResult,
@@ -33,38 +29,6 @@ from x_client.rate_limit import RateLimitInfo
 from x_client.services.post_service import PostService
 
 
-@pytest.fixture
-def mock_config():
-    """Mock ConfigManager."""
-    config = Mock()
-    config.load_credentials = Mock()
-    return config
-
-
-@pytest.fixture
-def mock_post_service():
-    """Mock PostService."""
-    service = Mock()
-    service.client = Mock()
-    return service
-
-
-@pytest.fixture
-def mock_media_service():
-    """Mock MediaService."""
-    return Mock()
-
-
-@pytest.fixture
-def adapter(mock_config, mock_post_service, mock_media_service):
-    """Create XMCPAdapter with mocked dependencies."""
-    return XMCPAdapter(
-        config=mock_config,
-        post_service=mock_post_service,
-        media_service=mock_media_service,
-    )
-
-
 # ============================================================================
 # Post Operations Tests
 # ============================================================================
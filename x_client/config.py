@@ -5,6 +5,7 @@ Configuration management utilities for x_client.
 from __future__ import annotations
 
 import os
+import stat
 from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Protocol
@@ -21,6 +22,9 @@ ENV_VAR_MAP = {
     "bearer_token": "X_BEARER_TOKEN",
 }
 
+# Reverse lookup used when parsing .env lines (env var name -> field name).
+_ENV_NAME_TO_FIELD = {env_name: field for field, env_name in ENV_VAR_MAP.items()}
+
 
 class CredentialsProvider(Protocol):
     """Abstract provider used to decouple persistence from runtime usage."""
@@ -93,6 +97,8 @@ class ConfigManager:
     ) -> None:
         self._env = env or os.environ
         self._dotenv_path = Path(dotenv_path) if dotenv_path else Path(".env")
+        # Stat signature of the parsed .env and the credentials it held.
+        self._dotenv_cache: tuple[tuple[int, ...], XCredentials | None] | None = None
 
     def load_credentials(
         self,
@@ -134,9 +140,35 @@ class ConfigManager:
 
     def _load_from_dotenv(self) -> XCredentials | None:
         path = self._dotenv_path
-        if not path.exists() or not path.is_file():
+        try:
+            file_stat = path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
             return None
 
+        # Re-parse only when the file has changed since the last read. The inode
+        # catches atomic replaces; an in-place rewrite to the same size within
+        # the filesystem's timestamp granularity can still go unnoticed.
+        key = (
+            file_stat.st_ino,
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            file_stat.st_ctime_ns,
+        )
+        if self._dotenv_cache is not None and self._dotenv_cache[0] == key:
+            cached = self._dotenv_cache[1]
+            return cached.model_copy() if cached else None
+
+        credentials = self._parse_dotenv(path)
+        self._dotenv_cache = (key, credentials)
+        return credentials.model_copy() if credentials else None
+
+    def _invalidate_dotenv_cache(self) -> None:
+        self._dotenv_cache = None
+
+    @staticmethod
+    def _parse_dotenv(path: Path) -> XCredentials | None:
         values: dict[str, str | None] = {key: None for key in ENV_VAR_MAP}
 
         for line in path.read_text(encoding="utf-8").splitlines():
@@ -151,10 +183,9 @@ class ConfigManager:
             key = key.strip()
             value = raw_value.strip().strip('"').strip("'")
 
-            for field, env_name in ENV_VAR_MAP.items():
-                if key == env_name:
-                    values[field] = value or None
-                    break
+            field = _ENV_NAME_TO_FIELD.get(key)
+            if field is not None:
+                values[field] = value or None
 
         credentials = XCredentials.from_mapping(values)
         return credentials if not credentials.is_empty() else None
@@ -203,3 +234,4 @@ class ConfigManager:
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text("\n".join(updated_lines) + "\n", encoding="utf-8")
         os.chmod(path, 0o600)
+        self._invalidate_dotenv_cache()
@@ -37,13 +37,16 @@ class WordBoundaryStrategy:
 
         tokens = re.split(r"(\s+)", stripped)
         chunks: list[str] = []
-        current = ""
+        # Accumulate the current chunk as parts and join once on flush.
+        parts: list[str] = []
+        current_len = 0
 
         def flush() -> None:
-            nonlocal current
-            if current:
-                chunks.append(current.rstrip())
-                current = ""
+            nonlocal current_len
+            if parts:
+                chunks.append("".join(parts).rstrip())
+                parts.clear()
+                current_len = 0
 
         for token in tokens:
             if not token:
@@ -56,12 +59,16 @@ class WordBoundaryStrategy:
                     chunks.append(token[start : start + limit])
                 continue
 
-            if len(current) + token_len <= limit:
-                current += token
+            if current_len + token_len <= limit:
+                parts.append(token)
+                current_len += token_len
                 continue
 
             flush()
-            current = token.lstrip() if token[0].isspace() else token
+            head = token.lstrip() if token[0].isspace() else token
+            if head:
+                parts.append(head)
+                current_len = len(head)
 
         flush()
         return [chunk for chunk in chunks if chunk]